@@ -1,28 +1,122 @@
 import json
+import os
 
-# File to store contacts
-CONTACTS_FILE = 'contacts.json'
+# orjson is faster and encodes straight to bytes; fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Load contacts from the file
+# Encode one record to bytes
+def _dumps(record):
+    if orjson is not None:
+        try:
+            return orjson.dumps(record)
+        except orjson.JSONEncodeError:
+            # orjson rejects lone surrogates (e.g. from surrogateescape
+            # input); the stdlib escapes them instead
+            pass
+    return json.dumps(record).encode('utf-8')
+
+# Decode one record from bytes
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# File to store contacts: an append-only log, one JSON record per line
+CONTACTS_FILE = 'contacts.ndjson'
+# Older versions stored the whole list here
+LEGACY_CONTACTS_FILE = 'contacts.json'
+
+# Append handle kept open across calls, and the number of records in the log
+_log = None
+_log_records = 0
+
+# Load contacts by replaying the log
 def load_contacts():
+    global _log_records
+    if not os.path.exists(CONTACTS_FILE) and os.path.exists(LEGACY_CONTACTS_FILE):
+        try:
+            with open(LEGACY_CONTACTS_FILE, 'rb') as file:
+                contacts = _loads(file.read())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return []
+        if not isinstance(contacts, list):
+            return []
+        save_contacts(contacts)
+        return contacts
+
+    contacts = []
+    _log_records = 0
+    # A crash can leave a torn last line; appending after it would glue the
+    # next record onto it, so rewrite a clean log before that can happen
+    damaged = False
     try:
-        with open(CONTACTS_FILE, 'r') as file:
-            return json.load(file)
-    except (FileNotFoundError, json.JSONDecodeError):
+        with open(CONTACTS_FILE, 'rb') as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    damaged = True
+                try:
+                    record = _loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    damaged = True
+                    continue
+                if not isinstance(record, dict):
+                    damaged = True
+                    continue
+                if record.get('op') == 'del':
+                    idx = record.get('idx')
+                    if not isinstance(idx, int) or not 0 <= idx < len(contacts):
+                        damaged = True
+                        continue
+                    contacts.pop(idx)
+                else:
+                    contacts.append(record)
+                _log_records += 1
+    except FileNotFoundError:
         return []
+    if damaged:
+        save_contacts(contacts)
+    return contacts
 
-# Save contacts to the file
+# Rewrite the log so it holds only the live contacts
 def save_contacts(contacts):
-    with open(CONTACTS_FILE, 'w') as file:
-        json.dump(contacts, file)
+    global _log, _log_records
+    if _log is not None:
+        _log.close()
+        _log = None
+    tmp_file = CONTACTS_FILE + '.tmp'
+    with open(tmp_file, 'wb') as file:
+        for contact in contacts:
+            file.write(_dumps(contact) + b'\n')
+    os.replace(tmp_file, CONTACTS_FILE)
+    _log_records = len(contacts)
+
+# Append one record to the log, compacting it once it is mostly dead records
+def append_record(record, contacts):
+    global _log, _log_records
+    if _log is None:
+        _log = open(CONTACTS_FILE, 'ab', buffering=8192)
+    _log.write(_dumps(record) + b'\n')
+    _log.flush()
+    _log_records += 1
+    if _log_records > 2 * len(contacts):
+        save_contacts(contacts)
 
 # Add a new contact
 def add_contact(contacts):
     name = input("Enter contact name: ")
     phone = input("Enter contact phone number: ")
     email = input("Enter contact email: ")
-    contacts.append({'name': name, 'phone': phone, 'email': email})
-    save_contacts(contacts)
+    contact = {'name': name, 'phone': phone, 'email': email}
+    contacts.append(contact)
+    try:
+        append_record(contact, contacts)
+    except Exception:
+        # Keep the list in step with the log
+        contacts.pop()
+        raise
     print("Contact added successfully!")
 
 # View all contacts
@@ -40,7 +134,11 @@ def delete_contact(contacts):
         index = int(input("Enter the number of the contact to delete: ")) - 1
         if 0 <= index < len(contacts):
             deleted_contact = contacts.pop(index)
-            save_contacts(contacts)
+            try:
+                append_record({'op': 'del', 'idx': index}, contacts)
+            except Exception:
+                contacts.insert(index, deleted_contact)
+                raise
             print(f"Deleted contact: {deleted_contact['name']}")
         else:
             print("Invalid contact number.")
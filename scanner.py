@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Basic Port Scanner - Procedural Version
+A simple non-blocking port scanner using basic Python concepts.
+"""
+
+import socket
+import argparse
+import bisect
+import errno
+import functools
+import heapq
+import selectors
+import statistics
+import struct
+import time
+import sys
+
+# Linux value; older Pythons do not expose the constant
+IP_BIND_ADDRESS_NO_PORT = getattr(socket, 'IP_BIND_ADDRESS_NO_PORT', 24)
+
+# Progress bar pieces, built once and sliced on every redraw
+_BAR_FULL = '=' * 50
+_BAR_EMPTY = '-' * 50
+
+def print_progress(current, total, bar_length=50):
+    """
+    Print a progress bar showing scan progress.
+    
+    Args:
+        current (int): Current progress value
+        total (int): Total value for 100% progress
+        bar_length (int): Length of the progress bar in characters
+    """
+    progress = float(current) / total
+    filled_length = int(progress * bar_length)
+    if bar_length <= len(_BAR_FULL):
+        bar = _BAR_FULL[:filled_length] + _BAR_EMPTY[:bar_length - filled_length]
+    else:
+        bar = '=' * filled_length + '-' * (bar_length - filled_length)
+    percent = int(progress * 100)
+    sys.stdout.write(f'\rScanning: [{bar}] {percent}% ({current}/{total})')
+    sys.stdout.flush()
+    if current == total:
+        print()  # New line when complete
+
+@functools.lru_cache(maxsize=65536)
+def get_service_name(port):
+    """Get service name for a port number."""
+    try:
+        return socket.getservbyport(port)
+    except (OSError, socket.error):
+        return "unknown"
+
+def new_scan_socket(source=None):
+    """
+    Create a non-blocking TCP socket set up for a single probe.
+
+    If `source` is given, the socket is bound to that local address.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # We never send a payload, so close with RST rather than FIN and skip
+    # TIME_WAIT, which would otherwise use up the ephemeral port range on
+    # large scans.
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER,
+                    struct.pack('ii', 1, 0))
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if source is not None:
+        if sys.platform == 'linux':
+            # bind() with port 0 would reserve a source port from the shared
+            # range; this defers the choice to connect(), which can reuse a
+            # port per 4-tuple. Without a bind, connect() does that anyway.
+            try:
+                sock.setsockopt(socket.IPPROTO_IP, IP_BIND_ADDRESS_NO_PORT, 1)
+            except OSError:
+                pass
+        sock.bind((source, 0))
+    sock.setblocking(False)
+    return sock
+
+def estimate_timeout(ip, sample_ports=(80, 443, 22), default=1.0):
+    """
+    Pick a connect timeout from the round-trip time to a few common ports.
+
+    Both an accepted connection and a refusal (RST) count as a sample. If
+    none of the ports answer, the default is returned.
+    """
+    samples = []
+    for port in sample_ports:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(default)
+        start = time.perf_counter()
+        try:
+            result = sock.connect_ex((ip, port))
+        except OSError:
+            continue
+        finally:
+            sock.close()
+        if result in (0, errno.ECONNREFUSED):
+            samples.append(time.perf_counter() - start)
+
+    if not samples:
+        return default
+    return max(0.05, 3 * statistics.median(samples))
+
+def scan_ports(ip, start_port, end_port, concurrency=1000, timeout=None,
+               show_progress=True, source=None):
+    """
+    Scan a range of ports on a given IP address.
+
+    Up to `concurrency` non-blocking connects are kept in flight at once and
+    reaped together through a single selector (epoll on Linux). When no
+    timeout is given, one is estimated from the target's round-trip time.
+    Probes are sent from the local address `source` if one is given.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    # Normalise to a dotted-quad literal once, so every connect_ex takes the
+    # numeric fast path instead of going through getaddrinfo
+    try:
+        ip = socket.inet_ntoa(socket.inet_aton(ip))
+    except OSError:
+        ip = socket.gethostbyname(ip)
+    if timeout is None:
+        timeout = estimate_timeout(ip)
+
+    open_ports = []
+    total_ports = end_port - start_port + 1
+    ports = iter(range(start_port, end_port + 1))
+    unlaunched = total_ports
+    sel = selectors.DefaultSelector()
+    deadlines = []  # min-heap of (deadline, port, sock)
+    # Sockets are created up front and refilled as connects finish, so the
+    # reap loop only has to pop a ready socket off this list
+    spare = [new_scan_socket(source) for _ in range(min(concurrency, total_ports))]
+    done = 0
+
+    def tick():
+        nonlocal done
+        done += 1
+        # Redrawing the bar for every port is wasted stdout writes
+        if show_progress and (done & 0x3F == 0 or done == total_ports):
+            print_progress(done, total_ports)
+
+    def retire(sock):
+        sock.close()
+        if len(spare) < unlaunched:
+            spare.append(new_scan_socket(source))
+        tick()
+
+    def finish(sock):
+        sel.unregister(sock)
+        retire(sock)
+
+    try:
+        while True:
+            # Top up the in-flight set with fresh connects
+            while spare:
+                port = next(ports, None)
+                if port is None:
+                    break
+                unlaunched -= 1
+                sock = spare.pop()
+                result = sock.connect_ex((ip, port))
+                if result not in (0, errno.EINPROGRESS):
+                    retire(sock)
+                    continue
+                sel.register(sock, selectors.EVENT_WRITE, data=port)
+                heapq.heappush(deadlines,
+                               (time.monotonic() + timeout, port, sock))
+
+            if not sel.get_map():
+                break
+
+            for key, _ in sel.select(timeout=0.05):
+                port = key.data
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    bisect.insort(open_ports, port)
+                finish(key.fileobj)
+
+            # Time out stragglers; entries for sockets that already
+            # finished are closed (fileno -1) and just dropped
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                _, _, sock = heapq.heappop(deadlines)
+                if sock.fileno() != -1:
+                    finish(sock)
+    finally:
+        for sock in spare:
+            sock.close()
+        # Connects still in flight if the scan was interrupted
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
+
+    return [(port, get_service_name(port)) for port in open_ports]
+
+def print_results(target, ip, open_ports, duration):
+    """Print scan results in a formatted table."""
+    print("\n" + "="*70)
+    print(f"Scan Results for {target}")
+    print(f"Scan duration: {duration:.2f} seconds")
+    print("="*70 + "\n")
+
+    if open_ports:
+        print(f"Found {len(open_ports)} open ports:\n")
+        print("PORT".ljust(10) + "SERVICE".ljust(20))
+        print("-" * 30)
+        for port, service in open_ports:
+            print(f"{str(port).ljust(10)}{service.ljust(20)}")
+    else:
+        print("No open ports found")
+    print()
+
+def main():
+    """Main function to parse arguments and initiate the port scan."""
+    parser = argparse.ArgumentParser(description='Less Basic Port Scanner')
+    parser.add_argument('target', help='Target IP address or hostname')
+    parser.add_argument('-s', '--start', type=int, default=1,
+                      help='Starting port (default: 1)')
+    parser.add_argument('-e', '--end', type=int, default=1024,
+                      help='Ending port (default: 1024)')
+    parser.add_argument('-c', '--concurrency', '-t', '--threads',
+                      dest='concurrency', type=int, default=1000,
+                      help='Maximum simultaneous connections (default: 1000)')
+    parser.add_argument('-o', '--output', help='Output file name')
+    parser.add_argument('-S', '--source',
+                      help='Local address to send probes from')
+    parser.add_argument('--no-progress', dest='progress', action='store_false',
+                      help='Do not show the progress bar')
+
+    args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("concurrency must be at least 1")
+
+    try:
+        ip = socket.gethostbyname(args.target)
+        
+        print("\nStarting Less Basic Port Scanner")
+        print(f"Target: {args.target} ({ip})")
+        print(f"Port range:{args.start}-{args.end}")
+        print(f"Concurrency: {args.concurrency}")
+        timeout = estimate_timeout(ip)
+        print(f"Timeout {timeout:.2f} seconds\n")
+
+        start_time = time.time()
+        open_ports = scan_ports(ip, args.start, args.end, args.concurrency,
+                                timeout, args.progress, args.source)
+        duration = time.time() - start_time
+
+        print_results(args.target, ip, open_ports, duration)
+
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(f"Scan Results for {args.target} ({ip})\n")
+                f.write(f"Duration: {duration:.2f} seconds\n\n")
+                if open_ports:
+                    f.write("Open ports:\n")
+                    for port, service in open_ports:
+                        f.write(f"Port {port}: {service}\n")
+                else:
+                    f.write("No open ports found\n")
+
+    except socket.gaierror:
+        print("Error: Could not resolve hostname")
+    except KeyboardInterrupt:
+        print("\nScan interrupted by user")
+    except Exception as e:
+        print(f"An error occurred: {str(e)}")
+
+if __name__ == "__main__":
+    main()
+